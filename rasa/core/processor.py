@@ -576,8 +576,17 @@ class MessageProcessor:
         reminder_event: ReminderScheduled,
         sender_id: Text,
         output_channel: OutputChannel,
-    ) -> None:
-        """Handle a reminder that is triggered asynchronously."""
+    ) -> DialogueStateTracker:
+        """Handle a reminder that is triggered asynchronously.
+
+        Args:
+            reminder_event: The reminder which was triggered.
+            sender_id: The ID of the conversation the reminder belongs to.
+            output_channel: The output channel.
+
+        Returns:
+            The tracker of the conversation after handling the reminder.
+        """
         async with self.lock_store.lock(sender_id):
             tracker = await self.fetch_tracker_and_update_session(
                 sender_id, output_channel
@@ -598,6 +607,8 @@ class MessageProcessor:
                     intent, entities, tracker, output_channel
                 )
 
+        return tracker
+
     async def trigger_external_user_uttered(
         self,
         intent_name: Text,
@@ -930,11 +941,13 @@ class MessageProcessor:
         Reminders with the same `id` property will overwrite one another
         (i.e. only one of them will eventually run).
         """
-        for e in events:
-            if not isinstance(e, ReminderScheduled):
-                continue
+        reminders = [e for e in events if isinstance(e, ReminderScheduled)]
+        if not reminders:
+            return
 
-            (await jobs.scheduler()).add_job(
+        scheduler = await jobs.scheduler()
+        for e in reminders:
+            scheduler.add_job(
                 self.handle_reminder,
                 "date",
                 run_date=e.trigger_date_time,
@@ -949,15 +962,18 @@ class MessageProcessor:
         events: List[Event], tracker: DialogueStateTracker
     ) -> None:
         """Cancel reminders that match the `ReminderCancelled` event."""
+        cancellations = [e for e in events if isinstance(e, ReminderCancelled)]
+        if not cancellations:
+            return
+
         # All Reminders specified by ReminderCancelled events will be cancelled
-        for event in events:
-            if isinstance(event, ReminderCancelled):
-                scheduler = await jobs.scheduler()
-                for scheduled_job in scheduler.get_jobs():
-                    if event.cancels_job_with_name(
-                        scheduled_job.name, tracker.sender_id
-                    ):
-                        scheduler.remove_job(scheduled_job.id)
+        scheduler = await jobs.scheduler()
+        for scheduled_job in scheduler.get_jobs():
+            if any(
+                event.cancels_job_with_name(scheduled_job.name, tracker.sender_id)
+                for event in cancellations
+            ):
+                scheduler.remove_job(scheduled_job.id)
 
     async def _run_action(
         self,
@@ -247,6 +247,18 @@ class TrackerStore:
         """Save method that will be overridden by specific tracker."""
         raise NotImplementedError()
 
+    async def save_many(self, trackers: Iterable[DialogueStateTracker]) -> None:
+        """Saves multiple trackers.
+
+        This method may be overridden by the specific tracker store to save the
+        trackers with fewer round trips to the underlying storage.
+
+        Args:
+            trackers: The trackers to save. Their sender ids must be unique.
+        """
+        for tracker in trackers:
+            await self.save(tracker)
+
     async def exists(self, conversation_id: Text) -> bool:
         """Checks if tracker exists for the specified ID.
 
@@ -516,6 +528,40 @@ class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
             self.key_prefix + tracker.sender_id, serialised_tracker, ex=timeout
         )
 
+    async def save_many(
+        self,
+        trackers: Iterable[DialogueStateTracker],
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Saves multiple conversation states using a single Redis pipeline.
+
+        Args:
+            trackers: The trackers to save.
+            timeout: Expiration time of the stored trackers in seconds.
+        """
+        trackers = list(trackers)
+        if not trackers:
+            return
+
+        for tracker in trackers:
+            await self.stream_events(tracker)
+
+        if not timeout and self.record_exp:
+            timeout = self.record_exp
+
+        keys = [self.key_prefix + tracker.sender_id for tracker in trackers]
+        pipeline = self.red.pipeline()
+
+        for key, tracker, stored in zip(keys, trackers, self.red.mget(keys)):
+            if stored is not None:
+                prior_tracker = self.deserialise_tracker(tracker.sender_id, stored)
+
+                tracker = self._merge_trackers(prior_tracker, tracker)
+
+            pipeline.set(key, self.serialise_tracker(tracker), ex=timeout)
+
+        pipeline.execute()
+
     async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session.
 
@@ -1327,34 +1373,59 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
 
     async def save(self, tracker: DialogueStateTracker) -> None:
         """Update database with events from the current conversation."""
-        await self.stream_events(tracker)
+        await self.save_many([tracker])
+
+    async def save_many(self, trackers: Iterable[DialogueStateTracker]) -> None:
+        """Update database with events from multiple conversations.
+
+        The events of all trackers are added in a single transaction.
+
+        Args:
+            trackers: The trackers to save.
+        """
+        trackers = list(trackers)
+
+        for tracker in trackers:
+            await self.stream_events(tracker)
 
         with self.session_scope() as session:
-            # only store recent events
-            events = self._additional_events(session, tracker)
+            for tracker in trackers:
+                session.add_all(self._new_sql_events(session, tracker))
+                # make the rows visible to `_additional_events` of later trackers
+                session.flush()
+            session.commit()
 
-            for event in events:
-                data = event.as_dict()
-                intent = (
-                    data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
-                )
-                action = data.get("name")
-                timestamp = data.get("timestamp")
-
-                # noinspection PyArgumentList
-                session.add(
-                    self.SQLEvent(
-                        sender_id=tracker.sender_id,
-                        type_name=event.type_name,
-                        timestamp=timestamp,
-                        intent_name=intent,
-                        action_name=action,
-                        data=json.dumps(data),
-                    )
+        for tracker in trackers:
+            logger.debug(
+                f"Tracker with sender_id '{tracker.sender_id}' stored to database"
+            )
+
+    def _new_sql_events(
+        self, session: "Session", tracker: DialogueStateTracker
+    ) -> List["SQLTrackerStore.SQLEvent"]:
+        """Creates database rows for the events which aren't stored yet."""
+        sql_events = []
+
+        # only store recent events
+        for event in self._additional_events(session, tracker):
+            data = event.as_dict()
+            intent = data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
+            action = data.get("name")
+            timestamp = data.get("timestamp")
+
+            # noinspection PyArgumentList
+            sql_events.append(
+                self.SQLEvent(
+                    sender_id=tracker.sender_id,
+                    type_name=event.type_name,
+                    timestamp=timestamp,
+                    intent_name=intent,
+                    action_name=action,
+                    data=json.dumps(data),
                 )
-            session.commit()
+            )
 
-        logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
+        return sql_events
 
     def _additional_events(
         self, session: "Session", tracker: DialogueStateTracker
@@ -1453,6 +1524,15 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             await self.fallback_tracker_store.save(tracker)
 
+    async def save_many(self, trackers: Iterable[DialogueStateTracker]) -> None:
+        """Calls `save_many` method of primary tracker store."""
+        trackers = list(trackers)
+        try:
+            await self._tracker_store.save_many(trackers)
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            await self.fallback_tracker_store.save_many(trackers)
+
     async def retrieve_full_tracker(
         self, sender_id: Text
     ) -> Optional[DialogueStateTracker]:
@@ -1648,6 +1728,15 @@ class AwaitableTrackerStore(TrackerStore):
         result = self._tracker_store.save(tracker)
         return await result if isawaitable(result) else result
 
+    async def save_many(self, trackers: Iterable[DialogueStateTracker]) -> None:
+        """Saves the trackers one by one using the `save` wrapper.
+
+        Custom tracker stores might implement a synchronous `save` method which
+        the inherited `save_many` of the primary tracker store would not await.
+        """
+        for tracker in trackers:
+            await self.save(tracker)
+
     async def retrieve_full_tracker(
         self, conversation_id: Text
     ) -> Optional[DialogueStateTracker]:
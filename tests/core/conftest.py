@@ -5,12 +5,13 @@ from sanic.request import Request
 import uuid
 from datetime import datetime
 
-from typing import Generator, Callable, Dict, Text
+from typing import AsyncGenerator, Generator, Callable, Dict, Text
 
 from scipy import sparse
 
 import pytest
 
+from rasa.core import jobs
 from rasa.core.agent import Agent
 from rasa.core.channels.channel import CollectingOutputChannel, OutputChannel
 from rasa.shared.core.domain import Domain
@@ -18,7 +19,7 @@ from rasa.shared.core.events import ReminderScheduled, UserUttered, ActionExecut
 from rasa.core.nlg import TemplatedNaturalLanguageGenerator, NaturalLanguageGenerator
 from rasa.core.processor import MessageProcessor
 from rasa.shared.core.slots import Slot
-from rasa.core.tracker_store import MongoTrackerStore
+from rasa.core.tracker_store import InMemoryTrackerStore, MongoTrackerStore
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.nlu.training_data.features import Features
 from rasa.shared.nlu.constants import INTENT, ACTION_NAME, FEATURE_TYPE_SENTENCE
@@ -71,14 +72,42 @@ def loop(
     yield event_loop
 
 
-@pytest.fixture
-def default_channel() -> OutputChannel:
+@pytest.fixture(scope="session")
+def _default_channel() -> CollectingOutputChannel:
     return CollectingOutputChannel()
 
 
 @pytest.fixture
-async def default_processor(default_agent: Agent) -> MessageProcessor:
-    return default_agent.processor
+def default_channel(_default_channel: CollectingOutputChannel) -> OutputChannel:
+    # The channel is shared across tests, so drop messages of previous tests.
+    # Reminder jobs which could send to it later are removed by `default_processor`.
+    _default_channel.messages.clear()
+    return _default_channel
+
+
+@pytest.fixture(scope="session")
+async def _default_processor(trained_default_agent_model: Text) -> MessageProcessor:
+    return Agent.load(trained_default_agent_model).processor
+
+
+@pytest.fixture
+async def default_processor(
+    _default_processor: MessageProcessor,
+) -> AsyncGenerator[MessageProcessor, None]:
+    # The processor is shared across tests to avoid loading the model every time.
+    # Give each test an empty tracker store and undo changes to its attributes.
+    original_attributes = dict(vars(_default_processor))
+    original_session_config = _default_processor.domain.session_config
+    _default_processor.tracker_store = InMemoryTrackerStore(_default_processor.domain)
+
+    yield _default_processor
+
+    # Reminders scheduled during the test would otherwise run against the shared
+    # processor after the test finished.
+    (await jobs.scheduler()).remove_all_jobs()
+
+    vars(_default_processor).update(original_attributes)
+    _default_processor.domain.session_config = original_session_config
 
 
 @pytest.fixture
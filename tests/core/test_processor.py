@@ -1,18 +1,19 @@
 import asyncio
 import datetime
-from http import HTTPStatus
 import os.path
 import shutil
 import textwrap
+import warnings
 from pathlib import Path
 
 import freezegun
 import pytest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from unittest.mock import MagicMock
 from rasa.plugin import plugin_manager
 
 import time
-import uuid
+import itertools
 import json
 from _pytest.monkeypatch import MonkeyPatch
 from _pytest.logging import LogCaptureFixture
@@ -34,6 +35,7 @@ from rasa.core.actions.action import (
 from rasa.core.nlg import NaturalLanguageGenerator, TemplatedNaturalLanguageGenerator
 from rasa.core.policies.policy import PolicyPrediction
 from tests.conftest import (
+    AsyncMock,
     with_assistant_id,
     with_assistant_ids,
     with_model_id,
@@ -92,6 +94,16 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_sender_ids = itertools.count()
+
+# trigger time for reminders which are handled directly instead of being scheduled
+_REMINDER_TRIGGER_DATE_TIME = datetime.datetime.now()
+
+
+def unique_sender_id() -> Text:
+    """Returns a sender id which is unique within this test module."""
+    return f"sender-{next(_sender_ids)}"
+
 
 async def test_message_processor(
     default_channel: CollectingOutputChannel, default_processor: MessageProcessor
@@ -108,7 +120,16 @@ async def test_message_processor(
 async def test_message_id_logging(default_processor: MessageProcessor):
     message = UserMessage("If Meg was an egg would she still have a leg?")
     tracker = DialogueStateTracker("1", [])
-    await default_processor._handle_message_with_tracker(message, tracker)
+    parse_data = {
+        "text": message.text,
+        "intent": {"name": None, "confidence": 0.0},
+        "entities": [],
+    }
+    # the NLU prediction is irrelevant here, so don't run the NLU pipeline
+    with mock.patch.object(
+        default_processor, "_parse_message_with_graph", return_value=parse_data
+    ):
+        await default_processor._handle_message_with_tracker(message, tracker)
     logged_event = tracker.events[-1]
 
     assert logged_event.message_id == message.message_id
@@ -119,11 +140,22 @@ async def test_parsing(default_processor: MessageProcessor):
     with mock.patch(
         "rasa.core.processor.MessageProcessor._parse_message_with_graph"
     ) as mocked_function:
-        # Case1: message has intent and entities explicitly set.
-        message = UserMessage('/greet{"name": "boy"}')
-        parsed = await default_processor.parse_message(message)
-        assert parsed["intent"][INTENT_NAME_KEY] == "greet"
-        assert parsed["entities"][0]["entity"] == "name"
+        # Case1: messages with explicitly set intents (and optional entities).
+        cases = [
+            ('/greet{"name": "boy"}', "greet", 1.0, ["name"]),
+            ("/goodbye", "goodbye", 1.0, []),
+            ('/greet@0.5{"name": "boy"}', "greet", 0.5, ["name"]),
+        ]
+        all_parsed = await asyncio.gather(
+            *[
+                default_processor.parse_message(UserMessage(text))
+                for text, _, _, _ in cases
+            ]
+        )
+        for parsed, (_, intent, confidence, entities) in zip(all_parsed, cases):
+            assert parsed["intent"][INTENT_NAME_KEY] == intent
+            assert parsed["intent"]["confidence"] == confidence
+            assert [entity["entity"] for entity in parsed["entities"]] == entities
         mocked_function.assert_not_called()
 
         # Case2: Normal user message.
@@ -152,9 +184,11 @@ async def test_check_for_unseen_feature(default_processor: MessageProcessor):
     default_processor.domain = new_domain
 
     parsed = await default_processor.parse_message(message)
-    with pytest.warns(UserWarning) as record:
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
         default_processor._check_for_unseen_features(parsed)
     assert len(record) == 2
+    assert all(issubclass(warning.category, UserWarning) for warning in record)
 
     assert record[0].message.args[0].startswith("Parsed an intent 'greet'")
     assert record[1].message.args[0].startswith("Parsed an entity 'name'")
@@ -168,7 +202,8 @@ async def test_default_intent_recognized(
 ):
     message = UserMessage(f"/{default_intent}")
     parsed = await default_processor.parse_message(message)
-    with pytest.warns(None) as record:
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
         default_processor._check_for_unseen_features(parsed)
     assert len(record) == 0
 
@@ -184,30 +219,23 @@ async def test_http_parsing(trained_default_agent_model: Text, domain: Domain):
         "text": "lunch?",
     }
 
-    with aioresponses() as mocked:
-        mocked.post(
-            "https://interpreter.com/model/parse",
-            repeat=True,
-            status=HTTPStatus.OK,
-            body=json.dumps(response_body),
-        )
+    inter = RasaNLUHttpInterpreter(endpoint_config=endpoint)
+    processor = MessageProcessor(
+        trained_default_agent_model,
+        InMemoryTrackerStore(domain),
+        InMemoryLockStore(),
+        NaturalLanguageGenerator(),
+        http_interpreter=inter,
+    )
 
-        inter = RasaNLUHttpInterpreter(endpoint_config=endpoint)
-        processor = MessageProcessor(
-            trained_default_agent_model,
-            InMemoryTrackerStore(domain),
-            InMemoryLockStore(),
-            NaturalLanguageGenerator(),
-            http_interpreter=inter,
-        )
+    # the HTTP request itself is covered by the tests of `RasaNLUHttpInterpreter`
+    with mock.patch.object(
+        inter, "_rasa_http_parse", AsyncMock(return_value=response_body)
+    ) as mocked:
         data = await processor.parse_message(message)
 
-        r = tests.utilities.latest_request(
-            mocked, "POST", "https://interpreter.com/model/parse"
-        )
-
-        assert r
-        assert data == response_body
+    mocked.assert_called_once_with(message.text, message.sender_id)
+    assert data == response_body
 
 
 async def test_http_parsing_default_response(
@@ -217,63 +245,93 @@ async def test_http_parsing_default_response(
 
     endpoint = EndpointConfig("https://interpreter.com")
 
-    with aioresponses() as mocked:
-        mocked.post(
-            "https://interpreter.com/model/parse",
-            repeat=True,
-            status=HTTPStatus.OK,
-            body=None,
-        )
+    inter = RasaNLUHttpInterpreter(endpoint_config=endpoint)
+    processor = MessageProcessor(
+        trained_default_agent_model,
+        InMemoryTrackerStore(domain),
+        InMemoryLockStore(),
+        NaturalLanguageGenerator(),
+        http_interpreter=inter,
+    )
 
-        inter = RasaNLUHttpInterpreter(endpoint_config=endpoint)
-        processor = MessageProcessor(
-            trained_default_agent_model,
-            InMemoryTrackerStore(domain),
-            InMemoryLockStore(),
-            NaturalLanguageGenerator(),
-            http_interpreter=inter,
-        )
+    with mock.patch.object(
+        inter, "_rasa_http_parse", AsyncMock(return_value=None)
+    ) as mocked:
         data = await processor.parse_message(message)
 
-        r = tests.utilities.latest_request(
-            mocked, "POST", "https://interpreter.com/model/parse"
-        )
+    mocked.assert_called_once_with(message.text, message.sender_id)
+    assert data == {
+        "intent": {INTENT_NAME_KEY: "", "confidence": 0.0},
+        "entities": [],
+        "text": "",
+    }
 
-        assert r
-        assert data == {
-            "intent": {INTENT_NAME_KEY: "", "confidence": 0.0},
-            "entities": [],
-            "text": "",
-        }
+
+async def save_tracker_with_events(
+    processor: MessageProcessor, events: List[Event]
+) -> Text:
+    """Stores a new tracker with the given events and returns its sender id."""
+    sender_id = unique_sender_id()
+    tracker = await processor.tracker_store.get_or_create_tracker(sender_id)
+
+    for event in events:
+        tracker.update(event)
+
+    await processor.tracker_store.save(tracker)
+
+    return sender_id
 
 
 async def test_reminder_scheduled(
     default_channel: CollectingOutputChannel, default_processor: MessageProcessor
 ):
-    sender_id = uuid.uuid4().hex
-
-    reminder = ReminderScheduled("remind", datetime.datetime.now())
-    tracker = await default_processor.tracker_store.get_or_create_tracker(sender_id)
-
-    tracker.update(UserUttered("test"))
-    tracker.update(ActionExecuted("action_schedule_reminder"))
-    tracker.update(reminder)
+    reminder = ReminderScheduled("remind", _REMINDER_TRIGGER_DATE_TIME)
+    sender_id = await save_tracker_with_events(
+        default_processor,
+        [UserUttered("test"), ActionExecuted("action_schedule_reminder"), reminder],
+    )
 
-    await default_processor.tracker_store.save(tracker)
+    t = await default_processor.handle_reminder(reminder, sender_id, default_channel)
 
-    await default_processor.handle_reminder(reminder, sender_id, default_channel)
+    assert list(t.events)[1:5] == [
+        UserUttered("test"),
+        ActionExecuted("action_schedule_reminder"),
+        reminder,
+        UserUttered(
+            f"{EXTERNAL_MESSAGE_PREFIX}remind",
+            intent={INTENT_NAME_KEY: "remind", IS_EXTERNAL: True},
+        ),
+    ]
 
-    # retrieve the updated tracker
-    t = await default_processor.tracker_store.retrieve(sender_id)
 
-    assert t.events[1] == UserUttered("test")
-    assert t.events[2] == ActionExecuted("action_schedule_reminder")
-    assert isinstance(t.events[3], ReminderScheduled)
-    assert t.events[4] == UserUttered(
-        f"{EXTERNAL_MESSAGE_PREFIX}remind",
-        intent={INTENT_NAME_KEY: "remind", IS_EXTERNAL: True},
+@pytest.mark.parametrize(
+    "kill_on_user_message, events_after_reminder, number_of_events",
+    [
+        # the user message cancels the reminder
+        (True, [UserUttered("test")], 3),
+        # the restart cancels the reminder
+        (False, [Restarted(), UserUttered("test")], 4),
+    ],
+)
+async def test_reminder_not_executed(
+    default_channel: CollectingOutputChannel,
+    default_processor: MessageProcessor,
+    kill_on_user_message: bool,
+    events_after_reminder: List[Event],
+    number_of_events: int,
+):
+    reminder = ReminderScheduled(
+        "utter_greet",
+        _REMINDER_TRIGGER_DATE_TIME,
+        kill_on_user_message=kill_on_user_message,
+    )
+    sender_id = await save_tracker_with_events(
+        default_processor, [reminder, *events_after_reminder]
     )
 
+    t = await default_processor.handle_reminder(reminder, sender_id, default_channel)
+    assert len(t.events) == number_of_events  # nothing should have been executed
+
 
 async def test_reminder_lock(
     default_channel: CollectingOutputChannel,
@@ -282,16 +340,11 @@ async def test_reminder_lock(
 ):
     caplog.clear()
     with caplog.at_level(logging.DEBUG):
-        sender_id = uuid.uuid4().hex
-
-        reminder = ReminderScheduled("remind", datetime.datetime.now())
-        tracker = await default_processor.tracker_store.get_or_create_tracker(sender_id)
-
-        tracker.update(UserUttered("test"))
-        tracker.update(ActionExecuted("action_schedule_reminder"))
-        tracker.update(reminder)
-
-        await default_processor.tracker_store.save(tracker)
+        reminder = ReminderScheduled("remind", _REMINDER_TRIGGER_DATE_TIME)
+        sender_id = await save_tracker_with_events(
+            default_processor,
+            [UserUttered("test"), ActionExecuted("action_schedule_reminder"), reminder],
+        )
 
         await default_processor.handle_reminder(reminder, sender_id, default_channel)
 
@@ -301,7 +354,7 @@ async def test_reminder_lock(
 async def test_trigger_external_latest_input_channel(
     default_channel: CollectingOutputChannel, default_processor: MessageProcessor
 ):
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     tracker = await default_processor.tracker_store.get_or_create_tracker(sender_id)
     input_channel = "test_input_channel_external"
 
@@ -317,77 +370,60 @@ async def test_trigger_external_latest_input_channel(
     assert tracker.get_latest_input_channel() == input_channel
 
 
-async def test_reminder_aborted(
-    default_channel: CollectingOutputChannel, default_processor: MessageProcessor
-):
-    sender_id = uuid.uuid4().hex
+async def execute_all_scheduled_jobs(scheduler: AsyncIOScheduler) -> None:
+    """Runs all pending scheduler jobs directly instead of waiting for them to fire.
 
-    reminder = ReminderScheduled(
-        "utter_greet", datetime.datetime.now(), kill_on_user_message=True
-    )
-    tracker = await default_processor.tracker_store.get_or_create_tracker(sender_id)
-
-    tracker.update(reminder)
-    tracker.update(UserUttered("test"))  # cancels the reminder
-
-    await default_processor.tracker_store.save(tracker)
-    await default_processor.handle_reminder(reminder, sender_id, default_channel)
-
-    # retrieve the updated tracker
-    t = await default_processor.tracker_store.retrieve(sender_id)
-    assert len(t.events) == 3  # nothing should have been executed
-
-
-async def wait_until_all_jobs_were_executed(
-    timeout_after_seconds: Optional[float] = None,
-) -> None:
-    total_seconds = 0.0
-    while len((await jobs.scheduler()).get_jobs()) > 0 and (
-        not timeout_after_seconds or total_seconds < timeout_after_seconds
-    ):
-        await asyncio.sleep(0.1)
-        total_seconds += 0.1
+    Each job is removed from the scheduler before it is run, so the scheduler can't
+    trigger it a second time while it is being awaited. The jobs are run
+    concurrently, as reminders of the same conversation are serialized by the
+    processor's lock store anyway.
+    """
+    pending_jobs = scheduler.get_jobs()
+    for job in pending_jobs:
+        scheduler.remove_job(job.id)
 
-    if total_seconds >= timeout_after_seconds:
-        jobs.kill_scheduler()
-        raise TimeoutError
+    await asyncio.gather(*[job.func(*job.args, **job.kwargs) for job in pending_jobs])
 
 
 async def test_reminder_cancelled_multi_user(
     default_channel: CollectingOutputChannel, default_processor: MessageProcessor
 ):
-    sender_ids = [uuid.uuid4().hex, uuid.uuid4().hex]
-    trackers = []
-    for sender_id in sender_ids:
-        tracker = await default_processor.tracker_store.get_or_create_tracker(sender_id)
-
-        tracker.update(UserUttered("test"))
-        tracker.update(ActionExecuted("action_reminder_reminder"))
-        tracker.update(
-            ReminderScheduled(
-                "greet", datetime.datetime.now(), kill_on_user_message=True
-            )
+    sender_ids = [unique_sender_id(), unique_sender_id()]
+    trackers = [
+        DialogueStateTracker.from_events(
+            sender_id,
+            [
+                ActionExecuted(ACTION_LISTEN_NAME),
+                UserUttered("test"),
+                ActionExecuted("action_reminder_reminder"),
+                ReminderScheduled(
+                    "greet", datetime.datetime.now(), kill_on_user_message=True
+                ),
+            ],
         )
-        trackers.append(tracker)
+        for sender_id in sender_ids
+    ]
 
     # cancel all reminders (one) for the first user
     trackers[0].update(ReminderCancelled())
 
+    scheduler = await jobs.scheduler()
+
+    await default_processor.tracker_store.save_many(trackers)
     for tracker in trackers:
-        await default_processor.tracker_store.save(tracker)
         await default_processor._schedule_reminders(
             tracker.events, tracker, default_channel
         )
     # check that the jobs were added
-    assert len((await jobs.scheduler()).get_jobs()) == 2
+    assert len(scheduler.get_jobs()) == 2
 
     for tracker in trackers:
         await default_processor._cancel_reminders(tracker.events, tracker)
     # check that only one job was removed
-    assert len((await jobs.scheduler()).get_jobs()) == 1
+    assert len(scheduler.get_jobs()) == 1
 
     # execute the jobs
-    await wait_until_all_jobs_were_executed(timeout_after_seconds=5.0)
+    await execute_all_scheduled_jobs(scheduler)
 
     tracker_0 = await default_processor.tracker_store.retrieve(sender_ids[0])
     # there should be no utter_greet action
@@ -416,7 +452,7 @@ async def test_reminder_cancelled_cancels_job_with_name(
     sender_id = "][]][xy,,=+2f'[:/;>]  <0d]A[e_,02"
 
     reminder = ReminderScheduled(
-        intent="greet", trigger_date_time=datetime.datetime.now()
+        intent="greet", trigger_date_time=_REMINDER_TRIGGER_DATE_TIME
     )
     job_name = reminder.scheduled_job_name(sender_id)
     reminder_cancelled = ReminderCancelled()
@@ -432,7 +468,7 @@ async def test_reminder_cancelled_cancels_job_with_name_special_name(
     name = "wkjbgr,34(,*&%^^&*(OP#LKMN V#NF# # #R"
 
     reminder = ReminderScheduled(
-        intent="greet", trigger_date_time=datetime.datetime.now(), name=name
+        intent="greet", trigger_date_time=_REMINDER_TRIGGER_DATE_TIME, name=name
     )
     job_name = reminder.scheduled_job_name(sender_id)
     reminder_cancelled = ReminderCancelled(name)
@@ -448,16 +484,18 @@ async def cancel_reminder_and_check(
     num_jobs_before: int,
     num_jobs_after: int,
 ) -> None:
+    scheduler = await jobs.scheduler()
+
     # cancel the sixth reminder
     tracker.update(reminder_canceled_event)
 
     # check that the jobs were added
-    assert len((await jobs.scheduler()).get_jobs()) == num_jobs_before
+    assert len(scheduler.get_jobs()) == num_jobs_before
 
     await default_processor._cancel_reminders(tracker.events, tracker)
 
     # check that only one job was removed
-    assert len((await jobs.scheduler()).get_jobs()) == num_jobs_after
+    assert len(scheduler.get_jobs()) == num_jobs_after
 
 
 async def test_reminder_cancelled_by_name(
@@ -528,37 +566,18 @@ async def test_reminder_cancelled_all(
     )
 
 
-async def test_reminder_restart(
-    default_channel: CollectingOutputChannel, default_processor: MessageProcessor
-):
-    sender_id = uuid.uuid4().hex
-
-    reminder = ReminderScheduled(
-        "utter_greet", datetime.datetime.now(), kill_on_user_message=False
-    )
-    tracker = await default_processor.tracker_store.get_or_create_tracker(sender_id)
-
-    tracker.update(reminder)
-    tracker.update(Restarted())  # cancels the reminder
-    tracker.update(UserUttered("test"))
-
-    await default_processor.tracker_store.save(tracker)
-    await default_processor.handle_reminder(reminder, sender_id, default_channel)
-
-    # retrieve the updated tracker
-    t = await default_processor.tracker_store.retrieve(sender_id)
-    assert len(t.events) == 4  # nothing should have been executed
-
-
+# freeze the time so that the "recent" timestamps below can't expire in case the
+# test runs long after it was collected
+@freezegun.freeze_time("2020-02-01")
 @pytest.mark.parametrize(
     "event_to_apply,session_expiration_time_in_minutes,has_expired",
     [
         # last user event is way in the past
         (UserUttered(timestamp=1), 60, True),
-        # user event are very recent
-        (UserUttered("hello", timestamp=time.time()), 120, False),
+        # user event are very recent (timestamp of the frozen time)
+        (UserUttered("hello", timestamp=1580515200), 120, False),
         # there is user event
-        (ActionExecuted(ACTION_LISTEN_NAME, timestamp=time.time()), 60, False),
+        (ActionExecuted(ACTION_LISTEN_NAME, timestamp=1580515200), 60, False),
         # Old event, but sessions are disabled
         (UserUttered("hello", timestamp=1), 0, False),
         # there is no event
@@ -571,18 +590,15 @@ async def test_has_session_expired(
     has_expired: bool,
     default_processor: MessageProcessor,
 ):
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
 
     default_processor.domain.session_config = SessionConfig(
         session_expiration_time_in_minutes, True
     )
-    # create new tracker without events
-    tracker = await default_processor.tracker_store.get_or_create_tracker(sender_id)
-    tracker.events.clear()
-
-    # apply desired event
-    if event_to_apply:
-        tracker.update(event_to_apply)
+    # create new tracker with only the desired event
+    tracker = DialogueStateTracker.from_events(
+        sender_id, [event_to_apply] if event_to_apply else []
+    )
 
     # noinspection PyProtectedMember
     assert default_processor._has_session_expired(tracker) == has_expired
@@ -596,7 +612,7 @@ async def test_update_tracker_session(
     default_processor: MessageProcessor,
     monkeypatch: MonkeyPatch,
 ):
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     tracker = await default_processor.tracker_store.get_or_create_tracker(sender_id)
 
     # patch `_has_session_expired()` so the `_update_tracker_session()` call actually
@@ -624,7 +640,7 @@ async def test_update_tracker_session_with_metadata(
 ):
     model_id = default_processor.model_metadata.model_id
     assistant_id = default_processor.model_metadata.assistant_id
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     message_metadata = {"metadataTestKey": "metadataTestValue"}
     message = UserMessage(
         text="hi",
@@ -669,7 +685,7 @@ async def test_custom_action_session_start_with_metadata(
     action_server_url = "http://some-url"
     default_processor.action_endpoint = EndpointConfig(action_server_url)
 
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     metadata = {"metadataTestKey": "metadataTestValue"}
     message = UserMessage(
         text="hi",
@@ -706,7 +722,7 @@ async def test_update_tracker_session_with_slots(
     default_processor: MessageProcessor,
     monkeypatch: MonkeyPatch,
 ):
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     tracker = await default_processor.tracker_store.get_or_create_tracker(sender_id)
 
     # apply a user uttered and five slots
@@ -750,7 +766,7 @@ async def test_fetch_tracker_and_update_session(
 ):
     model_id = default_processor.model_metadata.model_id
     assistant_id = default_processor.model_metadata.assistant_id
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     tracker = await default_processor.fetch_tracker_and_update_session(
         sender_id, default_channel
     )
@@ -794,7 +810,7 @@ async def test_fetch_tracker_with_initial_session(
     initial_events: List[Event],
     expected_event_types: List[Type[Event]],
 ):
-    conversation_id = uuid.uuid4().hex
+    conversation_id = unique_sender_id()
 
     tracker = DialogueStateTracker.from_events(conversation_id, initial_events)
 
@@ -820,7 +836,7 @@ async def test_fetch_tracker_with_initial_session_does_not_update_session(
     default_processor: MessageProcessor,
     monkeypatch: MonkeyPatch,
 ):
-    conversation_id = uuid.uuid4().hex
+    conversation_id = unique_sender_id()
 
     # the domain has a session expiration time of one second
     monkeypatch.setattr(
@@ -862,7 +878,7 @@ async def test_handle_message_with_session_start(
     default_processor: MessageProcessor,
     monkeypatch: MonkeyPatch,
 ):
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     model_id = default_processor.model_metadata.model_id
     assistant_id = default_processor.model_metadata.assistant_id
 
@@ -1026,7 +1042,7 @@ async def test_restart_triggers_session_start(
     default_model_storage: ModelStorage,
     default_execution_context: ExecutionContext,
 ):
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     model_id = default_processor.model_metadata.model_id
     assistant_id = default_processor.model_metadata.assistant_id
 
@@ -1630,7 +1646,7 @@ async def test_custom_action_triggers_action_extract_slots(
     slot_value = "happy"
     custom_action = "action_force_next_utter"
 
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     message = UserMessage(
         text="Activate custom action.",
         output_channel=CollectingOutputChannel(),
@@ -1715,7 +1731,7 @@ async def test_processor_executes_bot_uttered_returned_by_action_extract_slots(
     action_server_url = "http:/my-action-server:5055/webhook"
     processor.action_endpoint = EndpointConfig(action_server_url)
 
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     message = UserMessage(
         text="This is a test.",
         output_channel=CollectingOutputChannel(),
@@ -1820,7 +1836,7 @@ async def test_from_trigger_intent_no_form_condition_when_form_not_activated(
     slot_name = "test_trigger"
     slot_value = "testing123"
 
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     user_messages = [
         UserMessage(
             text="Hi",
@@ -1897,7 +1913,7 @@ async def test_processor_fetch_full_tracker_with_initial_session_inexistent_trac
     default_processor: MessageProcessor,
 ) -> None:
     """Test that the tracker is created with the correct initial session data."""
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     tracker = await default_processor.fetch_full_tracker_with_initial_session(sender_id)
 
     assert tracker.sender_id == sender_id
@@ -1920,7 +1936,7 @@ async def test_processor_fetch_full_tracker_with_initial_session_existing_tracke
     default_processor: MessageProcessor,
 ):
     """Test that an existing tracker is correctly retrieved."""
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     expected_events = [
         UserUttered("hello"),
         Restarted(),
@@ -1939,7 +1955,7 @@ async def test_run_anonymization_pipeline_no_pipeline(
     default_agent: Agent,
 ) -> None:
     processor = default_agent.processor
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     tracker = await processor.tracker_store.get_or_create_tracker(sender_id)
 
     manager = plugin_manager()
@@ -1960,7 +1976,7 @@ async def test_run_anonymization_pipeline_mocked_pipeline(
     default_agent: Agent,
 ) -> None:
     processor = default_agent.processor
-    sender_id = uuid.uuid4().hex
+    sender_id = unique_sender_id()
     tracker = await processor.tracker_store.get_or_create_tracker(sender_id)
 
     manager = plugin_manager()
@@ -23,7 +23,7 @@ from sqlalchemy.dialects.sqlite.base import SQLiteDialect
 from sqlalchemy.dialects.oracle.base import OracleDialect
 from sqlalchemy.engine.url import URL
 from typing import Any, Tuple, Text, Type, Dict, List, Union, Optional, ContextManager
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, call
 
 import rasa.core.tracker_store
 from rasa.shared.core.constants import (
@@ -482,6 +482,25 @@ async def test_fail_safe_tracker_store_with_save_error():
     on_error_callback.assert_called_once()
 
 
+async def test_fail_safe_tracker_store_with_save_many_error():
+    mocked_tracker_store = Mock()
+    mocked_tracker_store.save_many = Mock(side_effect=Exception())
+
+    fallback_tracker_store = Mock()
+    fallback_tracker_store.save_many = AsyncMock()
+
+    on_error_callback = Mock()
+
+    tracker_store = FailSafeTrackerStore(
+        mocked_tracker_store, on_error_callback, fallback_tracker_store
+    )
+    trackers = [DialogueStateTracker("first", []), DialogueStateTracker("second", [])]
+    await tracker_store.save_many(iter(trackers))
+
+    fallback_tracker_store.save_many.assert_called_once_with(trackers)
+    on_error_callback.assert_called_once()
+
+
 async def test_fail_safe_tracker_store_with_keys_error():
     mocked_tracker_store = Mock()
     mocked_tracker_store.keys = Mock(side_effect=Exception())
@@ -986,6 +1005,19 @@ def test_create_awaitable_tracker_store_with_endpoint_config():
     assert isinstance(tracker_store._tracker_store, NonAsyncTrackerStore)
 
 
+async def test_awaitable_tracker_store_save_many_with_non_async_save(domain: Domain):
+    non_async_tracker_store = NonAsyncTrackerStore(domain)
+    non_async_tracker_store.save = Mock()
+    tracker_store = AwaitableTrackerStore(non_async_tracker_store)
+    trackers = [DialogueStateTracker("first", []), DialogueStateTracker("second", [])]
+
+    await tracker_store.save_many(trackers)
+
+    assert non_async_tracker_store.save.call_args_list == [
+        call(tracker) for tracker in trackers
+    ]
+
+
 @pytest.mark.parametrize(
     "endpoints_file, expected_type",
     [
@@ -1195,6 +1227,54 @@ async def test_redis_tracker_store_retrieve(
     assert list(tracker.events) == events_after_restart
 
 
+@pytest.mark.parametrize(
+    "tracker_store_type",
+    [InMemoryTrackerStore, SQLTrackerStore, MockedRedisTrackerStore],
+)
+async def test_tracker_store_save_many(
+    tracker_store_type: Type[TrackerStore], domain: Domain
+) -> None:
+    tracker_store = tracker_store_type(domain)
+    trackers = [
+        DialogueStateTracker.from_events(
+            sender_id, [UserUttered("hi"), ActionExecuted(ACTION_LISTEN_NAME)]
+        )
+        for sender_id in [uuid.uuid4().hex, uuid.uuid4().hex]
+    ]
+
+    await tracker_store.save_many(trackers)
+
+    for tracker in trackers:
+        assert await tracker_store.retrieve(tracker.sender_id) == tracker
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type",
+    [InMemoryTrackerStore, SQLTrackerStore, MockedRedisTrackerStore],
+)
+async def test_tracker_store_save_many_with_existing_tracker(
+    tracker_store_type: Type[TrackerStore], domain: Domain
+) -> None:
+    tracker_store = tracker_store_type(domain)
+    existing_tracker = DialogueStateTracker.from_events(
+        uuid.uuid4().hex, [UserUttered("hi"), ActionExecuted(ACTION_LISTEN_NAME)]
+    )
+    await tracker_store.save(existing_tracker)
+
+    existing_tracker.update(UserUttered("bye"))
+    existing_tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    new_tracker = DialogueStateTracker.from_events(
+        uuid.uuid4().hex, [UserUttered("hello"), ActionExecuted(ACTION_LISTEN_NAME)]
+    )
+
+    await tracker_store.save_many([existing_tracker, new_tracker])
+
+    # the events stored before must neither be lost nor be stored twice
+    retrieved = await tracker_store.retrieve(existing_tracker.sender_id)
+    assert list(retrieved.events) == list(existing_tracker.events)
+    assert await tracker_store.retrieve(new_tracker.sender_id) == new_tracker
+
+
 async def test_redis_tracker_store_merge_trackers_same_session() -> None:
     start_session_sequence = [
         ActionExecuted(ACTION_SESSION_START_NAME),